@@ -1,9 +1,13 @@
 """Discord Server Management CLI Bot package."""
 
+from typing import TYPE_CHECKING, Any
+
 from .config import SessionConfig, ServerRequest, WebhookConfig, InvitationConfig
-from .discord_client import DiscordProvisioner, ServerProvisionResult
 from .cli import collect_session_configuration, display_summary
 
+if TYPE_CHECKING:
+    from .discord_client import DiscordProvisioner, ServerProvisionResult
+
 __all__ = [
     "SessionConfig",
     "ServerRequest",
@@ -14,3 +18,12 @@ __all__ = [
     "collect_session_configuration",
     "display_summary",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # discord.py is heavy to import; only load it once the provisioner is actually needed.
+    if name in {"DiscordProvisioner", "ServerProvisionResult"}:
+        from . import discord_client
+
+        return getattr(discord_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import getpass
+import itertools
+import sys
 from typing import Iterable, List, Optional
 
 from .config import InvitationConfig, SessionConfig, WebhookConfig
@@ -85,7 +87,7 @@ def _prompt_invitation_configuration() -> Optional[InvitationConfig]:
     return invitation
 
 
-def collect_session_configuration() -> SessionConfig:
+def collect_session_configuration(concurrency: Optional[int] = None) -> SessionConfig:
     """Interactively gather configuration from the user via CLI prompts."""
     display_intro()
     token = _prompt_token()
@@ -104,17 +106,24 @@ def collect_session_configuration() -> SessionConfig:
     invitation = _prompt_invitation_configuration()
     webhook = _prompt_webhook_configuration()
 
-    return SessionConfig(token=token, servers=servers, invitation=invitation, webhook=webhook)
+    return SessionConfig(
+        token=token,
+        servers=servers,
+        invitation=invitation,
+        webhook=webhook,
+        concurrency=concurrency,
+    )
 
 
 def display_summary(results: Iterable, progress: Optional[ProgressPrinter] = None) -> None:
     """Print a high-level summary of provisioned servers and invite links."""
-    lines = ["", "Summary:"]
-    for result in results:
-        lines.append(f" • {result.name} — Invite: {result.invite_url}")
-    message = "\n".join(lines)
+    lines = (f" • {result.name} — Invite: {result.invite_url}" for result in results)
     if progress:
         progress.divider()
-        progress.info(message)
+        progress.info("\n".join(itertools.chain(("", "Summary:"), lines)))
     else:
-        print(message)
+        write = sys.stdout.write
+        write("\nSummary:\n")
+        for line in lines:
+            write(f"{line}\n")
+        sys.stdout.flush()
@@ -39,3 +39,4 @@ class SessionConfig:
     servers: List[ServerRequest] = field(default_factory=list)
     invitation: Optional[InvitationConfig] = None
     webhook: Optional[WebhookConfig] = None
+    concurrency: Optional[int] = None
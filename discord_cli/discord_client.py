@@ -1,19 +1,63 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
+import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Dict, List, Optional, Tuple
 
 import aiohttp
 import discord
 
 from .config import ServerRequest, SessionConfig
 from .errors import AuthenticationError, DiscordOperationError
-from .invitations import InvitationManager
+from .invitations import GuildContext, InvitationManager
 from .progress import ProgressPrinter
-from .utils import with_rate_limit_retry
-from .webhook import ProvisioningNotification, WebhookNotifier
+from .ratelimit import DISCORD_REQUESTS_PER_SECOND, AsyncTokenBucket
+from .utils import retry_after_from_exception, with_rate_limit_retry
+from .webhook import MAX_EMBEDS_PER_MESSAGE, ProvisioningNotification, WebhookNotifier
+
+# Upper bound on servers provisioned at the same time; keeps the per-token
+# ratelimit bucket from being exhausted by the concurrent fan-out.
+MAX_CONCURRENT_PROVISIONS = 5
+# Seconds to wait for the gateway to announce a newly created guild.
+GUILD_JOIN_TIMEOUT = 10.0
+
+# Line breaks dropped from pasted tokens in a single translate pass.
+_NEWLINE_TABLE = str.maketrans("", "", "\n\r")
+_WHITESPACE_RE = re.compile(r"\s")
+
+_MAX_LOGGED_BODY_LENGTH = 1000
+_MAX_PRETTY_BODY_LENGTH = 4096
+# Response headers worth logging besides the X-RateLimit-* family.
+_LOGGED_HEADERS = frozenset({"retry-after", "cf-ray"})
+
+
+def _normalize_token(token: str) -> Tuple[str, List[str]]:
+    notes: List[str] = []
+    original = token or ""
+    working = original.strip()
+    if working != original:
+        notes.append("trimmed leading/trailing whitespace")
+    if len(working) >= 2 and working[0] == working[-1] and working[0] in {'"', "'"}:
+        notes.append("removed surrounding quotes")
+        working = working[1:-1].strip()
+    after_quote_strip = working.strip("'\"")
+    if after_quote_strip != working:
+        notes.append("removed stray edge quotes")
+        working = after_quote_strip
+    if "\n" in working or "\r" in working:
+        notes.append("removed newline characters")
+        working = working.translate(_NEWLINE_TABLE)
+    if working[:4].lower() == "bot ":
+        notes.append("removed 'Bot ' prefix")
+        working = working[4:].lstrip()
+    zero_width_space = "\u200b"
+    if zero_width_space in working:
+        notes.append("removed zero-width space characters")
+        working = working.replace(zero_width_space, "")
+    return working, notes
 
 
 @dataclass(slots=True)
@@ -38,15 +82,19 @@ class _ProvisioningClient(discord.Client):
         self._config = config
         self._progress = progress
         self._webhook = webhook
-        self._results: List[ServerProvisionResult] = []
+        self._results: List[Optional[ServerProvisionResult]] = [None] * len(config.servers)
+        self._rate_limiter = AsyncTokenBucket(DISCORD_REQUESTS_PER_SECOND)
         self._invitation_manager: Optional[InvitationManager] = None
         if config.invitation:
-            self._invitation_manager = InvitationManager(self, config.invitation, progress)
+            self._invitation_manager = InvitationManager(
+                self, config.invitation, progress, limiter=self._rate_limiter
+            )
+        self._webhook_queue: List[ProvisioningNotification] = []
         self._exception: Optional[BaseException] = None
 
     @property
     def results(self) -> List[ServerProvisionResult]:
-        return self._results
+        return [result for result in self._results if result is not None]
 
     @property
     def exception(self) -> Optional[BaseException]:
@@ -69,16 +117,25 @@ class _ProvisioningClient(discord.Client):
                 self._progress.step("Sending friend request to target user...")
                 await self._invitation_manager.send_friend_request()
 
-            for server in self._config.servers:
-                result = await self._provision_server(server)
-                self._results.append(result)
-                if self._webhook:
-                    notification = ProvisioningNotification(
-                        server_name=result.name,
-                        invite_url=result.invite_url,
-                        message=f"Server '{result.name}' has been provisioned successfully.",
-                    )
-                    await self._webhook.notify(notification)
+            semaphore = asyncio.Semaphore(
+                max(1, self._config.concurrency or MAX_CONCURRENT_PROVISIONS)
+            )
+            tasks = [
+                asyncio.create_task(self._guarded_provision(semaphore, index, server))
+                for index, server in enumerate(self._config.servers)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Like the old sequential loop, the first failure stops any further servers.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            finally:
+                if self._webhook and self._webhook_queue:
+                    pending, self._webhook_queue = self._webhook_queue, []
+                    await self._webhook.notify_batch(pending)
 
             self._progress.success("All requested servers have been created.")
         except Exception as exc:  # noqa: BLE001
@@ -87,17 +144,59 @@ class _ProvisioningClient(discord.Client):
         finally:
             await self.close()
 
-    async def _provision_server(self, request: ServerRequest) -> ServerProvisionResult:
-        self._progress.divider()
-        self._progress.step(f"Creating server '{request.name}'...")
+    async def _guarded_provision(
+        self, semaphore: asyncio.Semaphore, index: int, request: ServerRequest
+    ) -> ServerProvisionResult:
+        async with semaphore:
+            result, pending_admin_grant = await self._provision_server(request)
+        # The member-join wait can last minutes, so it runs outside the semaphore
+        # and never holds up the remaining servers.
+        if pending_admin_grant is not None:
+            await pending_admin_grant
+        self._results[index] = result
+        if self._webhook:
+            self._webhook_queue.append(
+                ProvisioningNotification(
+                    server_name=result.name,
+                    invite_url=result.invite_url,
+                    message=f"Server '{result.name}' has been provisioned successfully.",
+                )
+            )
+            if len(self._webhook_queue) >= MAX_EMBEDS_PER_MESSAGE:
+                pending, self._webhook_queue = self._webhook_queue, []
+                await self._webhook.notify_batch(pending)
+        return result
+
+    async def _resolve_created_guild(self, guild_id: int) -> discord.Guild:
+        # The gateway delivers GUILD_CREATE for new guilds with channels populated,
+        # so prefer the cached guild over a REST fetch.
+        guild = self.get_guild(guild_id)
+        if guild is not None:
+            return guild
+        try:
+            return await self.wait_for(
+                "guild_join", check=lambda g: g.id == guild_id, timeout=GUILD_JOIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            self._progress.debug(
+                f"Gateway did not deliver guild {guild_id} in time; fetching it via REST."
+            )
+        return await with_rate_limit_retry(
+            lambda: self.fetch_guild(guild_id), limiter=self._rate_limiter
+        )
 
-        async def _create_guild() -> discord.Guild:
-            guild_payload = await self.http.create_guild(request.name)
-            guild_id = int(guild_payload["id"])
-            return await self.fetch_guild(guild_id)
+    async def _provision_server(
+        self, request: ServerRequest
+    ) -> Tuple[ServerProvisionResult, Optional[Awaitable[object]]]:
+        self._progress.step(f"Creating server '{request.name}'...")
 
+        # Create and fetch are retried separately: a ratelimited fetch must never
+        # re-run the guild creation and leave a duplicate server behind.
         try:
-            guild = await with_rate_limit_retry(_create_guild)
+            guild_payload = await with_rate_limit_retry(
+                lambda: self.http.create_guild(request.name), limiter=self._rate_limiter
+            )
+            guild = await self._resolve_created_guild(int(guild_payload["id"]))
         except discord.Forbidden as exc:
             raise DiscordOperationError("Discord denied the guild creation request.") from exc
         except discord.HTTPException as exc:
@@ -107,44 +206,67 @@ class _ProvisioningClient(discord.Client):
 
         self._progress.success(f"Server '{guild.name}' created successfully.")
 
-        text_channel = guild.system_channel
-        if text_channel is None:
-            for channel in guild.text_channels:
-                if channel.permissions_for(guild.me).create_instant_invite:
-                    text_channel = channel
-                    break
+        # This account owns the freshly created guild, so any text channel can host an invite.
+        text_channel = guild.system_channel or (
+            guild.text_channels[0] if guild.text_channels else None
+        )
 
         if text_channel is None:
-            self._progress.step("Creating default text channel for invites...")
-            text_channel = await with_rate_limit_retry(lambda: guild.create_text_channel("general"))
+            self._progress.step(f"Creating default text channel for invites in '{guild.name}'...")
+            text_channel = await with_rate_limit_retry(
+                lambda: guild.create_text_channel("general"), limiter=self._rate_limiter
+            )
 
-        self._progress.step("Generating invite link...")
-        invite = await with_rate_limit_retry(
-            lambda: text_channel.create_invite(max_age=86400, max_uses=0, unique=True)
+        grant_admin = bool(
+            self._invitation_manager and self._invitation_manager.should_grant_admin
+        )
+        self._progress.step(f"Generating invite link for '{guild.name}'...")
+        if grant_admin:
+            self._progress.step(f"Preparing administrator role for '{guild.name}'...")
+        # Invite and role creation are independent, so issue both requests together.
+        invite, admin_role = await asyncio.gather(
+            with_rate_limit_retry(
+                lambda: text_channel.create_invite(max_age=86400, max_uses=0, unique=True),
+                limiter=self._rate_limiter,
+            ),
+            with_rate_limit_retry(
+                lambda: guild.create_role(
+                    name="AutoAdmin",
+                    permissions=discord.Permissions(administrator=True),
+                ),
+                limiter=self._rate_limiter,
+            )
+            if grant_admin
+            else asyncio.sleep(0, result=None),
         )
         self._progress.success(f"Invite link ready for '{guild.name}'.")
 
+        pending_admin_grant: Optional[Awaitable[object]] = None
         if self._invitation_manager:
-            if self._invitation_manager.should_grant_admin:
-                self._progress.step("Preparing administrator role...")
-                admin_role = await with_rate_limit_retry(
-                    lambda: guild.create_role(
-                        name="AutoAdmin",
-                        permissions=discord.Permissions(administrator=True),
-                    )
-                )
-                self._invitation_manager.register_admin_role(guild, admin_role)
+            context = GuildContext(guild=guild, invite=invite, admin_role=admin_role)
+            join_future = None
+            if admin_role is not None:
+                self._invitation_manager.register_admin_role(context)
+                join_future = self._invitation_manager.arm_member_join(guild)
 
-            await self._invitation_manager.create_invite_and_dm(guild, invite)
+            try:
+                await self._invitation_manager.create_invite_and_dm(guild, invite)
+            except BaseException:
+                if join_future is not None:
+                    join_future.cancel()
+                raise
 
             if self._invitation_manager.should_grant_admin:
-                await self._invitation_manager.monitor_member_join(guild)
+                pending_admin_grant = self._invitation_manager.monitor_member_join(
+                    context, join_future
+                )
 
-        return ServerProvisionResult(
+        result = ServerProvisionResult(
             name=guild.name,
             guild_id=guild.id,
             invite_url=invite.url,
         )
+        return result, pending_admin_grant
 
 
 class DiscordProvisioner:
@@ -160,6 +282,8 @@ class DiscordProvisioner:
         self._progress = progress or ProgressPrinter()
         self._webhook = webhook
         self._client = _ProvisioningClient(config, self._progress, webhook)
+        self._masked_token: Optional[Tuple[str, str]] = None
+        self._user_agent: Optional[str] = None
 
     async def execute(self) -> List[ServerProvisionResult]:
         try:
@@ -169,8 +293,7 @@ class DiscordProvisioner:
             try:
                 await self._client.close()
             finally:
-                if self._webhook:
-                    await self._webhook.close()
+                self._masked_token = None
         if self._client.exception:
             raise self._client.exception
         return self._client.results
@@ -178,18 +301,48 @@ class DiscordProvisioner:
     async def _authenticate(self) -> None:
         self._progress.step("Authenticating with Discord...")
         original_token = self._config.token
-        token, notes = self._normalize_token(original_token)
+        token, notes = _normalize_token(original_token)
         if not token:
             raise AuthenticationError("Discord token cannot be empty after normalization.")
+        self._config.token = token
+        validation: Optional[asyncio.Task[None]] = None
+        if self._progress.debug_enabled:
+            self._log_token_diagnostics(token, original_token, notes)
+            # The REST probe is diagnostic only, so run it alongside login instead of before it.
+            validation = asyncio.create_task(self._validate_token_with_rest(token))
+        try:
+            self._progress.debug("Using discord.py-self client.login(...) for authentication.")
+            await self._client.login(token)
+            self._progress.debug("discord.py-self login coroutine completed without raising.")
+        except BaseException as exc:
+            # Report the login failure right away instead of waiting on the diagnostic probe.
+            if validation is not None:
+                validation.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await validation
+            if isinstance(exc, discord.LoginFailure):
+                self._progress.debug(f"discord.py-self reported LoginFailure: {exc}")
+                raise AuthenticationError(
+                    "Discord rejected the provided token. Please verify it and try again."
+                ) from exc
+            if isinstance(exc, discord.HTTPException):
+                self._log_http_exception(exc, context="discord.py-self login")
+                raise self._build_authentication_error(exc) from exc
+            raise
+        if validation is not None:
+            await validation
+
+    def _log_token_diagnostics(
+        self, token: str, original_token: str, notes: List[str]
+    ) -> None:
         if token != original_token:
             self._progress.debug("Token value was normalized before authentication.")
-        self._config.token = token
         if notes:
             for note in notes:
                 self._progress.debug(f"Token normalization: {note}.")
         else:
             self._progress.debug("Token normalization: no changes applied.")
-        if token.lower().startswith("bot "):
+        if token[:4].lower() == "bot ":
             self._progress.debug("Warning: token still contains a 'Bot ' prefix after normalization.")
         else:
             self._progress.debug("Confirmed token will be used without a 'Bot ' prefix.")
@@ -203,19 +356,6 @@ class DiscordProvisioner:
             else "Token contains non-ASCII characters; using the provided value as-is."
         )
         self._progress.debug(ascii_message)
-        await self._validate_token_with_rest(token)
-        try:
-            self._progress.debug("Using discord.py-self client.login(...) for authentication.")
-            await self._client.login(token)
-            self._progress.debug("discord.py-self login coroutine completed without raising.")
-        except discord.LoginFailure as exc:
-            self._progress.debug(f"discord.py-self reported LoginFailure: {exc}")
-            raise AuthenticationError(
-                "Discord rejected the provided token. Please verify it and try again."
-            ) from exc
-        except discord.HTTPException as exc:
-            self._log_http_exception(exc, context="discord.py-self login")
-            raise self._build_authentication_error(exc) from exc
 
     async def _validate_token_with_rest(self, token: str) -> None:
         endpoint = "https://discord.com/api/v10/users/@me"
@@ -229,15 +369,12 @@ class DiscordProvisioner:
                 async with session.get(endpoint, headers=headers) as response:
                     status = response.status
                     self._progress.debug(f"Response status: {status}")
-                    body_text = await response.text()
+                    raw_body = await self._read_body_prefix(response, _MAX_PRETTY_BODY_LENGTH)
+                    body_text = raw_body.decode(response.charset or "utf-8", errors="replace")
                     formatted_body = self._format_response_body(body_text)
                     self._progress.debug(f"Response body: {formatted_body}")
                     if status == 200:
                         self._progress.debug("Token validation succeeded with /users/@me.")
-                    else:
-                        self._progress.debug(
-                            "Token validation did not return HTTP 200; proceeding with discord.py-self login."
-                        )
         except asyncio.TimeoutError:
             self._progress.debug("Token validation request timed out.")
         except aiohttp.ClientError as exc:
@@ -254,21 +391,24 @@ class DiscordProvisioner:
             "Authorization": token,
             "Accept": "application/json",
         }
-        http_client = getattr(self._client, "http", None)
-        user_agent = None
-        if http_client is not None:
-            user_agent = getattr(http_client, "user_agent", None)
-            if callable(user_agent):
-                user_agent = user_agent()
-        if not user_agent:
-            user_agent = "discord.py-self (cli validation)"
-        headers["User-Agent"] = user_agent
+        headers["User-Agent"] = self._validation_user_agent()
         return headers
 
+    def _validation_user_agent(self) -> str:
+        if self._user_agent is None:
+            try:
+                user_agent = self._client.http.user_agent
+                if callable(user_agent):
+                    user_agent = user_agent()
+            except AttributeError:
+                user_agent = None
+            self._user_agent = user_agent or "discord.py-self (cli validation)"
+        return self._user_agent
+
     def _mask_headers(self, headers: Dict[str, str], token: str) -> Dict[str, str]:
         masked = dict(headers)
         if "Authorization" in masked:
-            masked["Authorization"] = self._mask_token(token)
+            masked["Authorization"] = self._masked_token_for(token)
         return masked
 
     def _format_response_body(self, body: str) -> str:
@@ -277,45 +417,27 @@ class DiscordProvisioner:
         stripped = body.strip()
         if not stripped:
             return "<empty>"
-        try:
-            parsed = json.loads(stripped)
-        except (TypeError, ValueError):
-            formatted = stripped
-        else:
-            formatted = json.dumps(parsed, indent=2, sort_keys=True)
-        if len(formatted) > 1000:
-            return f"{formatted[:1000]}... [truncated]"
+        formatted = stripped
+        # Only pretty-print small JSON documents; anything else would be truncated anyway.
+        if len(stripped) <= _MAX_PRETTY_BODY_LENGTH and stripped[0] in "{[":
+            try:
+                parsed = json.loads(stripped)
+            except (TypeError, ValueError):
+                pass
+            else:
+                formatted = json.dumps(parsed, indent=2)
+        if len(formatted) > _MAX_LOGGED_BODY_LENGTH:
+            return f"{formatted[:_MAX_LOGGED_BODY_LENGTH]}... [truncated]"
         return formatted
 
-    @staticmethod
-    def _normalize_token(token: str) -> Tuple[str, List[str]]:
-        notes: List[str] = []
-        original = token or ""
-        working = original.strip()
-        if working != original:
-            notes.append("trimmed leading/trailing whitespace")
-        if len(working) >= 2 and working[0] == working[-1] and working[0] in {'"', "'"}:
-            notes.append("removed surrounding quotes")
-            working = working[1:-1].strip()
-        after_quote_strip = working.strip("'\"")
-        if after_quote_strip != working:
-            notes.append("removed stray edge quotes")
-            working = after_quote_strip
-        collapsed = working.replace("\n", "").replace("\r", "")
-        if collapsed != working:
-            notes.append("removed newline characters")
-            working = collapsed
-        if working.lower().startswith("bot "):
-            notes.append("removed 'Bot ' prefix")
-            working = working[4:].lstrip()
-        zero_width_space = "\u200b"
-        if zero_width_space in working:
-            notes.append("removed zero-width space characters")
-            working = working.replace(zero_width_space, "")
-        return working, notes
-
     def _token_format_message(self, token: str) -> str:
-        return f"Token format: {self._mask_token(token)} (masked, length: {len(token)})"
+        return f"Token format: {self._masked_token_for(token)} (masked, length: {len(token)})"
+
+    def _masked_token_for(self, token: str) -> str:
+        # Keyed on the token so a different value is never reported with a stale mask.
+        if self._masked_token is None or self._masked_token[0] != token:
+            self._masked_token = (token, self._mask_token(token))
+        return self._masked_token[1]
 
     @staticmethod
     def _mask_token(token: str) -> str:
@@ -327,19 +449,33 @@ class DiscordProvisioner:
             return f"{token[0]}***{token[-1]}"
         return f"{token[:3]}...{token[-3:]}"
 
+    @staticmethod
+    async def _read_body_prefix(response: aiohttp.ClientResponse, limit: int) -> bytes:
+        # Small bodies are read in full; oversized ones stop at the limit since
+        # they would be truncated anyway.
+        if response.content_length is not None and response.content_length <= limit:
+            return await response.read()
+        chunks: List[bytes] = []
+        size = 0
+        while size < limit:
+            chunk = await response.content.read(limit - size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        return b"".join(chunks)
+
     @staticmethod
     def _token_contains_whitespace(token: str) -> bool:
-        return any(ch.isspace() for ch in token)
+        return _WHITESPACE_RE.search(token) is not None
 
     @staticmethod
     def _is_ascii(token: str) -> bool:
-        try:
-            token.encode("ascii")
-        except UnicodeEncodeError:
-            return False
-        return True
+        return token.isascii()
 
     def _log_http_exception(self, exc: discord.HTTPException, *, context: str) -> None:
+        if not self._progress.debug_enabled:
+            return
         status = exc.status
         response = getattr(exc, "response", None)
         url = getattr(response, "url", None)
@@ -353,9 +489,11 @@ class DiscordProvisioner:
                 f"{context} response body: {self._format_response_body(text)}"
             )
         if response is not None and getattr(response, "headers", None) is not None:
-            headers = {k: v for k, v in response.headers.items()}
-            if "Authorization" in headers:
-                headers["Authorization"] = self._mask_token(headers["Authorization"])
+            headers = {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower().startswith("x-ratelimit") or key.lower() in _LOGGED_HEADERS
+            }
             self._progress.debug(f"{context} response headers: {headers}")
 
     def _build_authentication_error(self, exc: discord.HTTPException) -> AuthenticationError:
@@ -368,7 +506,7 @@ class DiscordProvisioner:
                 "verification or is currently locked by Discord."
             )
         elif status == 429:
-            retry_after = self._retry_after_from_exception(exc)
+            retry_after = retry_after_from_exception(exc)
             if retry_after is not None:
                 if retry_after >= 1:
                     seconds = max(1, int(round(retry_after)))
@@ -392,28 +530,3 @@ class DiscordProvisioner:
             else:
                 message = f"Failed to authenticate with Discord (HTTP {status})."
         return AuthenticationError(message)
-
-    @staticmethod
-    def _retry_after_from_exception(exc: discord.HTTPException) -> Optional[float]:
-        response = getattr(exc, "response", None)
-        if response is not None:
-            retry_header = response.headers.get("Retry-After")
-            if retry_header:
-                try:
-                    return float(retry_header)
-                except (TypeError, ValueError):
-                    pass
-        text = getattr(exc, "text", None)
-        if text:
-            try:
-                data = json.loads(text)
-            except (TypeError, ValueError):
-                return None
-            if isinstance(data, dict):
-                retry_after_value = data.get("retry_after")
-                if retry_after_value is not None:
-                    try:
-                        return float(retry_after_value)
-                    except (TypeError, ValueError):
-                        return None
-        return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 import discord
 from discord.http import Route
@@ -10,6 +10,7 @@ from discord.http import Route
 from .config import InvitationConfig
 from .errors import DiscordOperationError
 from .progress import ProgressPrinter
+from .ratelimit import AsyncTokenBucket
 from .utils import with_rate_limit_retry
 
 
@@ -20,6 +21,15 @@ class FriendRequestResult:
     discriminator: Optional[str]
 
 
+@dataclass(slots=True)
+class GuildContext:
+    """Per-server state carried through the invitation workflow."""
+
+    guild: discord.Guild
+    invite: discord.Invite
+    admin_role: Optional[discord.Role] = None
+
+
 class InvitationManager:
     """Handles friend requests, direct messages, and permission grants."""
 
@@ -28,11 +38,16 @@ class InvitationManager:
         client: discord.Client,
         invitation: InvitationConfig,
         progress: ProgressPrinter,
+        *,
+        limiter: Optional[AsyncTokenBucket] = None,
     ) -> None:
         self._client = client
+        self._limiter = limiter
         self._invitation = invitation
         self._progress = progress
-        self._admin_roles: dict[int, discord.Role] = {}
+        # Target user, their DM channel, and the message template, cached together.
+        self._dm_target: Optional[Tuple[discord.User, discord.DMChannel, str]] = None
+        self._dm_lock = asyncio.Lock()
         self._grant_admin = invitation.grant_admin
 
     @property
@@ -83,7 +98,8 @@ class InvitationManager:
                         "Unable to resolve user information after sending the friend request."
                     )
                 fetched_user = await with_rate_limit_retry(
-                    lambda: self._client.fetch_user(int(self._invitation.user_id))
+                    lambda: self._client.fetch_user(int(self._invitation.user_id)),
+                    limiter=self._limiter,
                 )
                 user_id = fetched_user.id
                 username = fetched_user.name
@@ -103,7 +119,7 @@ class InvitationManager:
             )
 
         try:
-            return await with_rate_limit_retry(_operation)
+            return await with_rate_limit_retry(_operation, limiter=self._limiter)
         except discord.HTTPException as exc:
             raise DiscordOperationError(
                 f"Failed to send friend request (status {exc.status})."
@@ -114,74 +130,123 @@ class InvitationManager:
             raise DiscordOperationError("Target user ID is required before sending an invite.")
 
         user_id = int(self._invitation.user_id)
-        try:
-            user_obj = await with_rate_limit_retry(lambda: self._client.fetch_user(user_id))
-        except discord.HTTPException as exc:
-            raise DiscordOperationError(
-                f"Failed to fetch target user for DM (status {exc.status})."
-            ) from exc
+        # Concurrent provisioning tasks share one fetch_user/create_dm instead of racing.
+        async with self._dm_lock:
+            dm_target = self._dm_target
+            if dm_target is None or dm_target[0].id != user_id:
+                try:
+                    user_obj = await with_rate_limit_retry(
+                        lambda: self._client.fetch_user(user_id), limiter=self._limiter
+                    )
+                except discord.HTTPException as exc:
+                    raise DiscordOperationError(
+                        f"Failed to fetch target user for DM (status {exc.status})."
+                    ) from exc
+                try:
+                    dm_channel = await with_rate_limit_retry(
+                        user_obj.create_dm, limiter=self._limiter
+                    )
+                except discord.HTTPException as exc:
+                    raise DiscordOperationError(
+                        f"Failed to send invite via DM (status {exc.status})."
+                    ) from exc
+                safe_name = user_obj.name.replace("{", "{{").replace("}", "}}")
+                dm_template = (
+                    f"Hello {safe_name}!\n"
+                    "You have been invited to join **{guild}**.\n"
+                    "Use this invite link to join: {url}"
+                )
+                dm_target = (user_obj, dm_channel, dm_template)
+                self._dm_target = dm_target
+        user_obj, dm_channel, dm_template = dm_target
 
-        message = (
-            f"Hello {user_obj.name}!\n"
-            f"You have been invited to join **{guild.name}**.\n"
-            f"Use this invite link to join: {invite.url}"
-        )
+        message = dm_template.format(guild=guild.name, url=invite.url)
         try:
-            dm_channel = await with_rate_limit_retry(user_obj.create_dm)
-            await with_rate_limit_retry(lambda: dm_channel.send(message))
+            await with_rate_limit_retry(
+                lambda: dm_channel.send(message), limiter=self._limiter
+            )
         except discord.HTTPException as exc:
+            self._invalidate_dm_cache(exc)
             raise DiscordOperationError(
                 f"Failed to send invite via DM (status {exc.status})."
             ) from exc
-        self._progress.success(f"Invite link sent via DM to {user_obj}.")
+        self._progress.success(f"Invite link for '{guild.name}' sent via DM to {user_obj}.")
 
-    def register_admin_role(self, guild: discord.Guild, role: discord.Role) -> None:
-        if self._grant_admin:
-            self._admin_roles[guild.id] = role
+    def _invalidate_dm_cache(self, exc: discord.HTTPException) -> None:
+        if exc.status in (403, 404):
+            self._dm_target = None
+
+    def register_admin_role(self, context: GuildContext) -> None:
+        if self._grant_admin and context.admin_role is not None:
             self._progress.success(
-                f"Administrator role '{role.name}' prepared for {guild.name}."
+                f"Administrator role '{context.admin_role.name}' prepared for {context.guild.name}."
             )
 
-    async def monitor_member_join(
+    def arm_member_join(
         self, guild: discord.Guild, timeout: float = 600.0
+    ) -> Optional[asyncio.Future[discord.Member]]:
+        """Start listening for the target user's join before the invite goes out."""
+        if not self._grant_admin or not self._invitation.user_id:
+            return None
+        user_id = self._invitation.user_id
+        return asyncio.ensure_future(
+            self._client.wait_for(
+                "member_join",
+                timeout=timeout,
+                check=lambda m: m.guild.id == guild.id and m.id == user_id,
+            )
+        )
+
+    async def monitor_member_join(
+        self,
+        context: GuildContext,
+        join_future: Optional[asyncio.Future[discord.Member]] = None,
+        timeout: float = 600.0,
     ) -> Optional[discord.Member]:
         if not self._grant_admin or not self._invitation.user_id:
+            if join_future is not None:
+                join_future.cancel()
             return None
 
+        guild = context.guild
         existing_member = guild.get_member(self._invitation.user_id)
         if existing_member is not None:
-            await self._grant_admin_to_member(existing_member)
+            if join_future is not None:
+                join_future.cancel()
+            await self._grant_admin_to_member(existing_member, context.admin_role)
             return existing_member
 
+        if join_future is None:
+            join_future = self.arm_member_join(guild, timeout)
+
         identifier = self._invitation.username or str(self._invitation.user_id)
         self._progress.step(
             f"Waiting for {identifier} to join {guild.name} to grant administrator permissions..."
         )
         try:
-            member = await self._client.wait_for(
-                "member_join",
-                timeout=timeout,
-                check=lambda m: m.guild.id == guild.id and m.id == self._invitation.user_id,
-            )
+            member = await join_future
         except asyncio.TimeoutError:
             self._progress.warning(
                 f"User {self._invitation.raw_identifier} did not join {guild.name} before timeout."
             )
             return None
 
-        await self._grant_admin_to_member(member)
+        await self._grant_admin_to_member(member, context.admin_role)
         return member
 
-    async def _grant_admin_to_member(self, member: discord.Member) -> None:
-        if not self._grant_admin:
-            return
-        role = self._admin_roles.get(member.guild.id)
-        if role is None:
+    async def _grant_admin_to_member(
+        self, member: discord.Member, role: Optional[discord.Role]
+    ) -> None:
+        if not self._grant_admin or role is None:
             return
         try:
-            await with_rate_limit_retry(lambda: member.add_roles(role))
+            await with_rate_limit_retry(
+                lambda: member.add_roles(role), limiter=self._limiter
+            )
         except discord.HTTPException as exc:
             raise DiscordOperationError(
                 f"Failed to grant administrator permissions (status {exc.status})."
             ) from exc
-        self._progress.success(f"Granted administrator permissions to {member.display_name}.")
+        self._progress.success(
+            f"Granted administrator permissions to {member.display_name} in {member.guild.name}."
+        )
@@ -1,23 +1,44 @@
 from __future__ import annotations
 
-import datetime as _dt
-from typing import Optional
+import sys
+import time
+from typing import Optional, Tuple
+
+_DIVIDER = "-" * 60 + "\n"
 
 
 class ProgressPrinter:
     """Utility to print formatted progress information to stdout."""
 
-    def __init__(self) -> None:
+    def __init__(self, debug: bool = False) -> None:
         self._last_message: Optional[str] = None
+        self._debug = debug
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
+        try:
+            # Keep each message flushed promptly on interactive terminals.
+            sys.stdout.reconfigure(line_buffering=True)
+        except (AttributeError, ValueError):
+            pass
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self._debug
 
     def _timestamp(self) -> str:
-        return _dt.datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        cached_second, cached_text = self._timestamp_cache
+        if now != cached_second:
+            cached_text = time.strftime("%H:%M:%S", time.localtime(now))
+            self._timestamp_cache = (now, cached_text)
+        return cached_text
 
     def info(self, message: str) -> None:
-        print(f"[{self._timestamp()}] {message}")
+        sys.stdout.write(f"[{self._timestamp()}] {message}\n")
         self._last_message = message
 
     def debug(self, message: str) -> None:
+        if not self._debug:
+            return
         self.info(f"[DEBUG] {message}")
 
     def step(self, message: str) -> None:
@@ -33,4 +54,4 @@ class ProgressPrinter:
         self.info(f"❌ {message}")
 
     def divider(self) -> None:
-        print("-" * 60)
+        sys.stdout.write(_DIVIDER)
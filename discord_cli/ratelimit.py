@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+# Discord allows 50 requests per second per token; stay a little below it.
+DISCORD_REQUESTS_PER_SECOND = 45.0
+
+
+class AsyncTokenBucket:
+    """Client-side token bucket shared by every request made during a session."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else rate
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def drain(self, seconds: float) -> None:
+        """Put the bucket into debt so every caller pauses for roughly ``seconds``.
+
+        Concurrent drains for the same 429 window share one pause instead of stacking.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self._rate)
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import re
-from typing import Awaitable, Callable, Iterable, List, Optional, TypeVar
-
-import discord
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, List, Optional, TypeVar
 
 from .config import InvitationConfig, ServerRequest
 from .errors import ConfigurationError, RateLimitError
 
+if TYPE_CHECKING:
+    import discord
+
+    from .ratelimit import AsyncTokenBucket
+
 T = TypeVar("T")
 
 
+MAX_RAW_SERVER_NAME_LENGTH = 256
 SERVER_NAME_REGEX = re.compile(r"[^\w\s-]")
+_USER_ID_REGEX = re.compile(r"\d{5,}")
+_DISCRIMINATOR_REGEX = re.compile(r"\d{4}")
+RETRY_AFTER_REGEX = re.compile(r'"retry_after"\s*:\s*([0-9]+(?:\.[0-9]+)?)')
 
 
 def sanitize_server_name(name: str) -> str:
-    cleaned = SERVER_NAME_REGEX.sub("", name).strip()
+    # Discord caps names at 100 characters, so only the head of very long pastes is scanned.
+    cleaned = SERVER_NAME_REGEX.sub("", name[:MAX_RAW_SERVER_NAME_LENGTH]).strip()
     if not cleaned:
         raise ConfigurationError("Server name cannot be empty after sanitisation.")
     return cleaned[:95]
@@ -37,12 +46,12 @@ def parse_target_user(identifier: str) -> InvitationConfig:
     if not identifier:
         raise ConfigurationError("Target user identifier cannot be empty.")
 
-    if re.fullmatch(r"\d{5,}", identifier):
+    if _USER_ID_REGEX.fullmatch(identifier):
         return InvitationConfig(raw_identifier=identifier, user_id=int(identifier))
 
     if "#" in identifier:
         username, _, discriminator = identifier.partition("#")
-        if not username or not discriminator or not re.fullmatch(r"\d{4}", discriminator):
+        if not username or not discriminator or not _DISCRIMINATOR_REGEX.fullmatch(discriminator):
             raise ConfigurationError(
                 "Discord username must be in the format username#1234 with a 4-digit discriminator."
             )
@@ -57,21 +66,55 @@ def parse_target_user(identifier: str) -> InvitationConfig:
     )
 
 
+def retry_after_from_exception(exc: discord.HTTPException) -> Optional[float]:
+    """Return the server-provided retry delay in seconds, if Discord sent one."""
+    response = getattr(exc, "response", None)
+    if response is not None:
+        retry_header = response.headers.get("Retry-After")
+        if retry_header:
+            try:
+                return float(retry_header)
+            except (TypeError, ValueError):
+                pass
+    text = getattr(exc, "text", None)
+    if text:
+        match = RETRY_AFTER_REGEX.search(text)
+        if match:
+            return float(match.group(1))
+    return None
+
+
 async def with_rate_limit_retry(
     operation: Callable[[], Awaitable[T]],
     *,
     retries: int = 5,
     base_delay: float = 2.0,
     backoff_factor: float = 2.0,
+    max_delay: float = 60.0,
+    jitter: bool = True,
+    limiter: Optional[AsyncTokenBucket] = None,
 ) -> T:
+    from discord.errors import HTTPException
+
     delay = base_delay
     for attempt in range(retries):
+        if limiter is not None:
+            await limiter.acquire()
         try:
             return await operation()
-        except discord.HTTPException as exc:
+        except HTTPException as exc:
             if exc.status == 429 and attempt < retries - 1:
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
+                retry_after = retry_after_from_exception(exc)
+                if retry_after is not None:
+                    if limiter is not None:
+                        # Make concurrent callers back off too, not just this one.
+                        limiter.drain(retry_after)
+                    await asyncio.sleep(retry_after)
+                    delay = base_delay
+                else:
+                    # Full jitter keeps concurrent retries from hitting the bucket in lockstep.
+                    await asyncio.sleep(random.uniform(0, delay) if jitter else delay)
+                    delay = min(delay * backoff_factor, max_delay)
                 continue
             raise
     raise RateLimitError("Exceeded maximum retries due to rate limits.")
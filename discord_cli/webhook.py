@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .config import WebhookConfig
 from .errors import DiscordOperationError
 from .progress import ProgressPrinter
 
+# Discord rejects webhook messages carrying more than 10 embeds.
+MAX_EMBEDS_PER_MESSAGE = 10
+
 
 @dataclass(slots=True)
 class ProvisioningNotification:
@@ -25,35 +33,81 @@ class WebhookNotifier:
         self._config = config
         self._progress = progress
         self._session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=30)
+
+    async def __aenter__(self) -> WebhookNotifier:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Open the keep-alive connection pool ahead of the first notification."""
+        await self._ensure_session()
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
         return self._session
 
     async def notify(self, payload: ProvisioningNotification) -> None:
-        if not self._config.enabled or not self._config.url:
+        await self._post(payload.message, [self._build_embed(payload)])
+
+    async def notify_batch(self, payloads: Sequence[ProvisioningNotification]) -> None:
+        """Send notifications as multi-embed messages, up to 10 embeds per request."""
+        if not payloads or not self._config.enabled or not self._config.url:
             return
 
-        session = await self._ensure_session()
-        data = {
-            "content": payload.message,
-            "embeds": [
-                {
-                    "title": "Discord Server Provisioned",
-                    "description": f"Server **{payload.server_name}** is ready.",
-                    "fields": [
-                        {"name": "Invite Link", "value": payload.invite_url},
-                    ],
-                }
+        chunks = [
+            payloads[start : start + MAX_EMBEDS_PER_MESSAGE]
+            for start in range(0, len(payloads), MAX_EMBEDS_PER_MESSAGE)
+        ]
+        await asyncio.gather(
+            *(
+                self._post(
+                    "\n".join(payload.message for payload in chunk),
+                    [self._build_embed(payload) for payload in chunk],
+                )
+                for chunk in chunks
+            )
+        )
+
+    @staticmethod
+    def _build_embed(payload: ProvisioningNotification) -> Dict[str, Any]:
+        return {
+            "title": "Discord Server Provisioned",
+            "description": f"Server **{payload.server_name}** is ready.",
+            "fields": [
+                {"name": "Invite Link", "value": payload.invite_url},
             ],
         }
+
+    async def _post(self, content: str, embeds: List[Dict[str, Any]]) -> None:
+        if not self._config.enabled or not self._config.url:
+            return
+
+        session = await self._ensure_session()
+        data: Dict[str, Any] = {"content": content, "embeds": embeds}
         if self._config.username:
             data["username"] = self._config.username
 
         try:
-            async with session.post(self._config.url, json=data) as response:
+            if orjson is not None:
+                request = session.post(
+                    self._config.url,
+                    data=orjson.dumps(data),
+                    headers={"Content-Type": "application/json"},
+                )
+            else:
+                request = session.post(self._config.url, json=data)
+            async with request as response:
                 if response.status >= 400:
                     body = await response.text()
                     raise DiscordOperationError(
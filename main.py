@@ -1,51 +1,78 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
+import contextlib
+from typing import Optional
 
-import discord
-
-from discord_cli import (
-    DiscordProvisioner,
-    collect_session_configuration,
-    display_summary,
-)
+from discord_cli import collect_session_configuration, display_summary
 from discord_cli.errors import ConfigurationError, DiscordCliError
 from discord_cli.progress import ProgressPrinter
 from discord_cli.webhook import WebhookNotifier
 
 
-async def _async_main() -> None:
-    progress = ProgressPrinter()
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Provision Discord servers interactively.")
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="print verbose authentication and HTTP diagnostics",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=None,
+        help="maximum number of servers provisioned at the same time (default: 5)",
+    )
+    return parser.parse_args()
+
+
+async def _async_main(debug: bool = False, concurrency: Optional[int] = None) -> None:
+    progress = ProgressPrinter(debug=debug)
 
     try:
-        config = collect_session_configuration()
+        config = collect_session_configuration(concurrency=concurrency)
     except ConfigurationError as exc:
         progress.error(str(exc))
         return
 
     progress.step("Starting Discord provisioning workflow...")
 
-    webhook_notifier = WebhookNotifier(config.webhook, progress) if config.webhook else None
-    provisioner = DiscordProvisioner(config, progress=progress, webhook=webhook_notifier)
+    import discord
 
-    try:
-        results = await provisioner.execute()
-    except DiscordCliError as exc:
-        progress.error(str(exc))
-    except discord.LoginFailure:
-        progress.error("Failed to authenticate with Discord. Please verify your token.")
-    except Exception as exc:  # noqa: BLE001
-        progress.error(f"An unexpected error occurred: {exc}")
-    else:
-        display_summary(results, progress=progress)
-    finally:
-        if webhook_notifier:
-            await webhook_notifier.close()
+    from discord_cli import DiscordProvisioner
+
+    async with contextlib.AsyncExitStack() as stack:
+        webhook_notifier = (
+            await stack.enter_async_context(WebhookNotifier(config.webhook, progress))
+            if config.webhook
+            else None
+        )
+        provisioner = DiscordProvisioner(config, progress=progress, webhook=webhook_notifier)
+
+        try:
+            results = await provisioner.execute()
+        except DiscordCliError as exc:
+            progress.error(str(exc))
+        except discord.LoginFailure:
+            progress.error("Failed to authenticate with Discord. Please verify your token.")
+        except Exception as exc:  # noqa: BLE001
+            progress.error(f"An unexpected error occurred: {exc}")
+        else:
+            display_summary(results, progress=progress)
 
 
 def main() -> None:
+    args = _parse_args()
     try:
-        asyncio.run(_async_main())
+        asyncio.run(_async_main(debug=args.debug, concurrency=args.concurrency))
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
 
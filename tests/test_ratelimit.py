@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+from typing import Callable
+from unittest import mock
+
+from discord_cli.ratelimit import AsyncTokenBucket
+
+
+class _FakeClock:
+    """Stands in for ``time.monotonic`` and ``asyncio.sleep`` so pacing is deterministic."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+class AsyncTokenBucketTests(unittest.TestCase):
+    def _waited(self, scenario: Callable[[AsyncTokenBucket], None], **kwargs: float) -> float:
+        """Return the simulated seconds one ``acquire`` waits after ``scenario`` ran."""
+        clock = _FakeClock()
+        with mock.patch("discord_cli.ratelimit.time", clock), mock.patch(
+            "asyncio.sleep", clock.sleep
+        ):
+            bucket = AsyncTokenBucket(**kwargs)
+            scenario(bucket)
+            start = clock.now
+            asyncio.run(bucket.acquire())
+        return clock.now - start
+
+    def test_acquire_paces_once_capacity_is_spent(self) -> None:
+        clock = _FakeClock()
+        with mock.patch("discord_cli.ratelimit.time", clock), mock.patch(
+            "asyncio.sleep", clock.sleep
+        ):
+            bucket = AsyncTokenBucket(rate=20.0, capacity=2)
+
+            async def scenario() -> None:
+                for _ in range(4):
+                    await bucket.acquire()
+
+            asyncio.run(scenario())
+        # Two tokens are spent up front; the other two arrive at 20 per second.
+        self.assertAlmostEqual(clock.now, 0.1)
+
+    def test_repeated_drains_do_not_add_up(self) -> None:
+        def drain_once(bucket: AsyncTokenBucket) -> None:
+            bucket.drain(0.3)
+
+        def drain_five_times(bucket: AsyncTokenBucket) -> None:
+            for _ in range(5):
+                bucket.drain(0.3)
+
+        single = self._waited(drain_once, rate=10.0)
+        self.assertGreaterEqual(single, 0.3)
+        self.assertAlmostEqual(self._waited(drain_five_times, rate=10.0), single)
+
+    def test_drain_does_not_shorten_an_existing_pause(self) -> None:
+        def drain_long(bucket: AsyncTokenBucket) -> None:
+            bucket.drain(0.5)
+
+        def drain_long_then_short(bucket: AsyncTokenBucket) -> None:
+            bucket.drain(0.5)
+            bucket.drain(0.1)
+
+        self.assertAlmostEqual(
+            self._waited(drain_long_then_short, rate=10.0),
+            self._waited(drain_long, rate=10.0),
+        )
+
+    def test_rejects_non_positive_rate(self) -> None:
+        with self.assertRaises(ValueError):
+            AsyncTokenBucket(rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()